@@ -1,15 +1,109 @@
-from datetime import timedelta
+import math
+from collections import namedtuple
 from typing import Optional, Tuple, List
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import gridspec
 from matplotlib import rcParams
-from matplotlib import ticker
+from matplotlib.ticker import AutoLocator, LogLocator, MultipleLocator, NullLocator
+from matplotlib import axis as maxis
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
 __author__ = "Ben Dichter"
 
+# attribute names forwarded to the invisible background axes
+_BIG_AX_METHODS = frozenset(
+    [
+        "get_yaxis",
+        "get_xaxis",
+        "get_shared_x_axes",
+        "get_shared_y_axes",
+        "get_second_yaxis",
+        "get_second_xaxis",
+        "get_legend",
+        "get_title",
+        "get_xlabel",
+        "get_ylabel",
+    ]
+)
+
+# Cached per-axes grid position. The is_* predicates on a SubplotSpec walk the
+# gridspec on every call, so they are evaluated once per axes at construction
+# and reused by the drawing/layout methods.
+_AxMeta = namedtuple(
+    "_AxMeta", ["ax", "is_first_row", "is_last_row", "is_first_col", "is_last_col"]
+)
+
+
+def _make_ax_meta(ax):
+    ss = ax.get_subplotspec()
+    return _AxMeta(
+        ax, ss.is_first_row(), ss.is_last_row(), ss.is_first_col(), ss.is_last_col()
+    )
+
+
+class _SpinelessAxes(Axes):
+    """Axes that never builds spines, used for the invisible background axes.
+
+    Spine construction is a sizable share of ``Axes.__init__`` and big_ax
+    hides all of its spines immediately, so skip creating them entirely.
+    These are the same hooks custom projections override; without spines the
+    tick transforms fall back to the grid transform.
+    """
+
+    def _gen_axes_spines(self, locations=None, offset=0.0, units="inches"):
+        return {}
+
+    def _init_axis(self):
+        # the base implementation also registers each axis with the four
+        # default spines, which do not exist here
+        self.xaxis = maxis.XAxis(self)
+        self.yaxis = maxis.YAxis(self)
+
+    def get_xaxis_transform(self, which="grid"):
+        return self._xaxis_transform
+
+    def get_yaxis_transform(self, which="grid"):
+        return self._yaxis_transform
+
+
+class _FixupFlusher(Artist):
+    """Invisible figure artist that runs deferred layout fixups.
+
+    Its very low zorder makes it the first child drawn by the figure, so any
+    tick/spine fixups pending from delegated plotting calls are applied just
+    before the axes render. This lets `subax_call` mark the layout dirty
+    instead of re-running the fixups after every single call.
+    """
+
+    def __init__(self, broken_axes):
+        super().__init__()
+        self._broken_axes = broken_axes
+        self.set_zorder(-1000)
+
+    def draw(self, renderer):
+        self._broken_axes._flush_fixups()
+
+
+class _SubaxDelegator:
+    """Callable that forwards a method call to every internal axes.
+
+    A module-level class rather than a closure so that figures holding a
+    `BrokenAxes` (reachable through its artists) stay picklable after the
+    delegator is cached in the instance dict.
+    """
+
+    def __init__(self, broken_axes, method):
+        self._broken_axes = broken_axes
+        self._method = method
+
+    def __call__(self, *args, **kwargs):
+        return self._broken_axes.subax_call(self._method, args, kwargs)
+
 
 class BrokenAxes:
     def __init__(
@@ -68,18 +162,25 @@ class BrokenAxes:
         for the discontinuities.
         """
 
-        self._spines = None
         self.diag_color: str = diag_color
         self.despine: bool = despine
         self.d: float = d
         self.tilt: float = tilt
         self.fig: Figure = fig if fig is not None else plt.gcf()
         self.diag_handles: List = []
+        self._diag_collection = None
+        self._diag_geometry = None
+        self._lims_cache = None
+        self._default_locators = {}
+        self._tick_base_cache = None
 
         width_ratios = width_ratios if width_ratios is not None else self._calculate_ratios(xlims, xscale)
         height_ratios = height_ratios if height_ratios is not None else self._calculate_ratios(ylims, yscale)[::-1]
 
         ncols, nrows = len(width_ratios), len(height_ratios)
+        # a 1x1 grid has no seams: no split marks to draw, no tick bases
+        # to reconcile
+        self._has_breaks = ncols > 1 or nrows > 1
 
         kwargs.update(
             ncols=ncols,
@@ -91,46 +192,113 @@ class BrokenAxes:
             gs = gridspec.GridSpecFromSubplotSpec(
                 subplot_spec=subplot_spec, *args, **kwargs
             )
-            self.big_ax = plt.Subplot(self.fig, subplot_spec)
+            self._big_ax_spec = subplot_spec
         else:
             gs = gridspec.GridSpec(*args, **kwargs)
-            self.big_ax = plt.Subplot(self.fig, gridspec.GridSpec(1, 1)[0])
-
-        [sp.set_visible(False) for sp in self.big_ax.spines.values()]
-        self.big_ax.set_xticks([])
-        self.big_ax.set_yticks([])
-        self.big_ax.patch.set_facecolor("none")
-
+            self._big_ax_spec = gs[:, :]
+        # the background axes is only needed for shared labels/title/legend,
+        # so defer building it until something asks for it
+        self._big_ax = None
+
+        # Share x within each column and y within each row at creation time,
+        # anchored on the first axes of the column/row, so matplotlib joins
+        # each shared group once instead of re-registering every axes pair.
         self.axs = []
-        for igs in gs:
-            ax = plt.Subplot(self.fig, igs)
-            self.fig.add_subplot(ax)
-            self.axs.append(ax)
-        self.fig.add_subplot(self.big_ax)
+        # silence per-axes stale notifications while the grid is assembled;
+        # one notification at the end is enough
+        stale_callback = self.fig.stale_callback
+        self.fig.stale_callback = None
+        try:
+            for i, igs in enumerate(gs):
+                row, col = divmod(i, ncols)
+                sharex = self.axs[col] if (xlims is not None and row > 0) else None
+                sharey = self.axs[row * ncols] if (ylims is not None and col > 0) else None
+                ax = self.fig.add_subplot(igs, sharex=sharex, sharey=sharey)
+                self.axs.append(ax)
+        finally:
+            self.fig.stale_callback = stale_callback
+        self.fig.stale = True
+
+        self._ax_meta = [_make_ax_meta(ax) for ax in self.axs]
+        # the same flags in column-wise (SoA) form, for vectorized masking
+        self._flag_matrix = np.array(
+            [
+                (meta.is_first_row, meta.is_last_row, meta.is_first_col, meta.is_last_col)
+                for meta in self._ax_meta
+            ]
+        )
 
         # get last axs row and first col
-        self.last_row = []
-        self.first_col = []
-        for ax in self.axs:
-            if ax.get_subplotspec().is_last_row():
-                self.last_row.append(ax)
-            if ax.get_subplotspec().is_first_col():
-                self.first_col.append(ax)
-
-        # Set common x/y lim for ax in the same col/row
-        # and share x and y between them
-        for i, ax in enumerate(self.axs):
-            if ylims is not None:
-                ax.set_ylim(ylims[::-1][i // ncols])
-                ax.sharey(self.first_col[i // ncols])
-            if xlims is not None:
-                ax.set_xlim(xlims[i % ncols])
-                ax.sharex(self.last_row[i % ncols])
+        self.last_row = [meta.ax for meta in self._ax_meta if meta.is_last_row]
+        self.first_col = [meta.ax for meta in self._ax_meta if meta.is_first_col]
+
+        self._spines = dict(
+            top=[meta.ax.spines["top"] for meta in self._ax_meta if meta.is_first_row],
+            right=[meta.ax.spines["right"] for meta in self._ax_meta if meta.is_last_col],
+            bottom=[meta.ax.spines["bottom"] for meta in self._ax_meta if meta.is_last_row],
+            left=[meta.ax.spines["left"] for meta in self._ax_meta if meta.is_first_col],
+        )
+
+        # Set common x/y lim once per anchor; shared axes inherit the limits
+        if ylims is not None:
+            ylims_rev = ylims[::-1]
+            for row, ax in enumerate(self.axs[::ncols]):
+                ax.set_ylim(ylims_rev[row])
+        if xlims is not None:
+            for col, ax in enumerate(self.axs[:ncols]):
+                ax.set_xlim(xlims[col])
+        self._fixup_dirty = False
+        self.fig.add_artist(_FixupFlusher(self))
+        self.fig.canvas.mpl_connect("resize_event", self._refresh_diag_segments)
+
+        self._apply_default_locators()
         self.standardize_ticks()
         if d:
             self.draw_diags()
         self.set_spines()
 
+    @property
+    def big_ax(self):
+        """The invisible background axes, created on first use."""
+        if self._big_ax is None:
+            self._big_ax = self._make_big_ax()
+        return self._big_ax
+
+    def _make_big_ax(self):
+        big_ax = _SpinelessAxes(self.fig, self._big_ax_spec)
+        # NullLocator short-circuits tick processing entirely, unlike the
+        # empty FixedLocator that set_xticks([]) would install
+        big_ax.xaxis.set_major_locator(NullLocator())
+        big_ax.xaxis.set_minor_locator(NullLocator())
+        big_ax.yaxis.set_major_locator(NullLocator())
+        big_ax.yaxis.set_minor_locator(NullLocator())
+        # an invisible patch never participates in draw, unlike a
+        # transparent one
+        big_ax.patch.set_visible(False)
+        # big_ax is fully styled already; add_axes skips the subplot
+        # registration work of add_subplot
+        self.fig.add_axes(big_ax)
+        return big_ax
+
+    def _apply_default_locators(self):
+        """Restore the default major locators on every internal axes.
+
+        Runs before each delegated plotting call so `standardize_ticks` sees
+        freshly auto-located ticks. The locator instances are cached per axis
+        so repeated calls re-bind them instead of allocating two new locators
+        per axes per call, and axes already on their default locator are left
+        untouched.
+        """
+        for ax in self.axs:
+            for axis in (ax.xaxis, ax.yaxis):
+                is_log = axis.get_scale() == "log"
+                default = self._default_locators.get(axis)
+                if default is None or isinstance(default, LogLocator) != is_log:
+                    default = LogLocator() if is_log else AutoLocator()
+                    self._default_locators[axis] = default
+                if axis.get_major_locator() is not default:
+                    axis.set_major_locator(default)
+
     @staticmethod
     def _calculate_ratios(lims, scale):
         """
@@ -146,19 +314,26 @@ class BrokenAxes:
         if lims is None:
             return [1]
 
-        if scale == "log":
-            ratios = [np.log(i[1]) - np.log(i[0]) for i in lims]
-        else:
-            ratios = [i[1] - i[0] for i in lims]
+        try:
+            arr = np.asarray(lims, dtype=float)
+        except (TypeError, ValueError):
+            # non-numeric limits, e.g. datetimes; only this slow path needs
+            # the timedelta probe, so import it here rather than at load time
+            from datetime import timedelta
 
-        # handle datetime xlims
-        if isinstance(ratios[0], timedelta):
-            ratios = [tt.total_seconds() for tt in ratios]
+            ratios = [i[1] - i[0] for i in lims]
+            if isinstance(ratios[0], timedelta):
+                ratios = [tt.total_seconds() for tt in ratios]
+            return ratios
 
-        return ratios
+        if scale == "log":
+            return (np.log(arr[:, 1]) - np.log(arr[:, 0])).tolist()
+        return (arr[:, 1] - arr[:, 0]).tolist()
 
     @staticmethod
     def draw_diag(ax, xpos, ypos, xlen, ylen, **kwargs):
+        """Draw a single diagonal mark. Kept for backwards compatibility;
+        `draw_diags` now batches all marks into one `LineCollection`."""
         return ax.plot((xpos - xlen, xpos + xlen), (ypos - ylen, ypos + ylen), **kwargs)
 
     def draw_diags(self, d=None, tilt=None):
@@ -175,82 +350,114 @@ class BrokenAxes:
             self.d = d
         if tilt is not None:
             self.tilt = tilt
+        if not self._has_breaks:
+            self.diag_handles = []
+            return
         size = self.fig.get_size_inches()
 
-        d_kwargs = dict(
-            transform=self.fig.transFigure,
-            color=self.diag_color,
-            clip_on=False,
-            lw=rcParams["axes.linewidth"],
-            ylen=self.d * np.sin(self.tilt * np.pi / 180) * size[0] / size[1],
-            xlen=self.d * np.cos(self.tilt * np.pi / 180)
+        # resolve all subplot positions up front, in one pass
+        positions = np.array(
+            [meta.ax.get_position().bounds for meta in self._ax_meta]
         )
 
-        ds = []
-        for ax in self.axs:
-            bounds = ax.get_position().bounds
-
-            if ax.get_subplotspec().is_last_row():
-                ypos = bounds[1]
-                if not ax.get_subplotspec().is_last_col():
-                    xpos = bounds[0] + bounds[2]
-                    ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-                if not ax.get_subplotspec().is_first_col():
-                    xpos = bounds[0]
-                    ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-
-            if ax.get_subplotspec().is_first_col():
-                xpos = bounds[0]
-                if not ax.get_subplotspec().is_first_row():
-                    ypos = bounds[1] + bounds[3]
-                    ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-                if not ax.get_subplotspec().is_last_row():
-                    ypos = bounds[1]
-                    ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-
-            if not self.despine:
-                if ax.get_subplotspec().is_first_row():
-                    ypos = bounds[1] + bounds[3]
-                    if not ax.get_subplotspec().is_last_col():
-                        xpos = bounds[0] + bounds[2]
-                        ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-                    if not ax.get_subplotspec().is_first_col():
-                        xpos = bounds[0]
-                        ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-
-                if ax.get_subplotspec().is_last_col():
-                    xpos = bounds[0] + bounds[2]
-                    if not ax.get_subplotspec().is_first_row():
-                        ypos = bounds[1] + bounds[3]
-                        ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-                    if not ax.get_subplotspec().is_last_row():
-                        ypos = bounds[1]
-                        ds += self.draw_diag(ax, xpos, ypos, **d_kwargs)
-        self.diag_handles = ds
+        # resize/tight_layout callbacks redraw even when nothing moved;
+        # skip the geometry rebuild when the marks would come out identical
+        geometry = (tuple(size), self.d, self.tilt, self.despine, positions.tobytes())
+        lc = self._diag_collection
+        if (
+            geometry == self._diag_geometry
+            and lc is not None
+            and lc in self.fig.artists
+        ):
+            # geometry is unchanged, but the color attribute may not be
+            lc.set_color(self.diag_color)
+            return
+        self._diag_geometry = geometry
+
+        # plain math trig: scalar inputs, no need for ufunc dispatch
+        rad = math.radians(self.tilt)
+        ylen = self.d * math.sin(rad) * size[0] / size[1]
+        xlen = self.d * math.cos(rad)
+
+        first_row, last_row, first_col, last_col = self._flag_matrix.T
+        left, bottom = positions[:, 0], positions[:, 1]
+        right = left + positions[:, 2]
+        top = bottom + positions[:, 3]
+
+        # which corner of which axes gets a split mark, as (mask, x, y) rows
+        corners = [
+            (last_row & ~last_col, right, bottom),
+            (last_row & ~first_col, left, bottom),
+            (first_col & ~first_row, left, top),
+            (first_col & ~last_row, left, bottom),
+        ]
+        if not self.despine:
+            corners += [
+                (first_row & ~last_col, right, top),
+                (first_row & ~first_col, left, top),
+                (last_col & ~first_row, right, top),
+                (last_col & ~last_row, right, bottom),
+            ]
 
-    def set_spines(self):
-        """Removes the spines of internal axes that are not boarder spines."""
+        xs = np.concatenate([x[mask] for mask, x, _ in corners])
+        ys = np.concatenate([y[mask] for mask, _, y in corners])
+        segments = np.empty((xs.size, 2, 2))
+        segments[:, 0, 0] = xs - xlen
+        segments[:, 0, 1] = ys - ylen
+        segments[:, 1, 0] = xs + xlen
+        segments[:, 1, 1] = ys + ylen
+
+        if lc is not None and lc in self.fig.artists:
+            lc.set_segments(segments)
+            # diag_color is a plain attribute, so it may have changed since
+            # the collection was built
+            lc.set_color(self.diag_color)
+        else:
+            lc = LineCollection(
+                segments,
+                transform=self.fig.transFigure,
+                colors=self.diag_color,
+                linewidths=rcParams["axes.linewidth"],
+                capstyle=rcParams["lines.solid_capstyle"],
+                clip_on=False,
+            )
+            self.fig.add_artist(lc)
+            self._diag_collection = lc
+        self.diag_handles = [lc]
 
-        # Helper function to hide axis elements
-        def hide_axis_elements(axis):
-            for element in (axis.get_majorticklines() + axis.get_minorticklines() +
-                            axis.get_majorticklabels() + axis.get_minorticklabels()):
-                element.set_visible(False)
+    def _refresh_diag_segments(self, event=None):
+        """Recompute the diagonal mark geometry after a figure resize.
 
-        for ax in self.axs:
+        The marks live in figure coordinates, so subplot bounds shifting with
+        the canvas would otherwise leave them misplaced. Only the segment
+        endpoints of the existing `LineCollection` are updated; no artists
+        are rebuilt.
+        """
+        lc = self._diag_collection
+        if lc is not None and lc in self.fig.artists:
+            self.draw_diags()
+
+    def set_spines(self):
+        """Removes the spines of internal axes that are not boarder spines."""
+        for meta in self._ax_meta:
+            ax = meta.ax
             ax.xaxis.tick_bottom()
             ax.yaxis.tick_left()
-            subplotspec = ax.get_subplotspec()
-            if not subplotspec.is_last_row():
-                ax.spines["bottom"].set_visible(False)
-                hide_axis_elements(ax.xaxis)
-            if self.despine or not subplotspec.is_first_row():
-                ax.spines["top"].set_visible(False)
-            if not subplotspec.is_first_col():
-                ax.spines["left"].set_visible(False)
-                hide_axis_elements(ax.yaxis)
-            if self.despine or not subplotspec.is_last_col():
-                ax.spines["right"].set_visible(False)
+            spines = ax.spines
+            # only touch spines that are still visible, so repeat calls
+            # (one per draw) do not re-trigger stale propagation
+            if not meta.is_last_row:
+                if spines["bottom"].get_visible():
+                    spines["bottom"].set_visible(False)
+                ax.tick_params(axis="x", which="both", bottom=False, labelbottom=False)
+            if (self.despine or not meta.is_first_row) and spines["top"].get_visible():
+                spines["top"].set_visible(False)
+            if not meta.is_first_col:
+                if spines["left"].get_visible():
+                    spines["left"].set_visible(False)
+                ax.tick_params(axis="y", which="both", left=False, labelleft=False)
+            if (self.despine or not meta.is_last_col) and spines["right"].get_visible():
+                spines["right"].set_visible(False)
 
     def standardize_ticks(self, xbase=None, ybase=None):
         """Make all the internal axes share tick bases
@@ -262,93 +469,131 @@ class BrokenAxes:
             this base. Otherwise, use the largest base across internal subplots
             for that axis.
         """
+        if not self._has_breaks:
+            return
+        # delegated calls apply uniformly, so the scales match across axes;
+        # query them once per call rather than once per axis
+        ax0 = self.axs[0]
+        x_is_log = ax0.xaxis.get_scale() == "log"
+        y_is_log = ax0.yaxis.get_scale() == "log"
+
+        # the auto-derived bases are a function of the scales, the limits and
+        # the canvas size (AutoLocator picks its tick count from the pixel
+        # extent), so reuse them only while none of those have changed
+        auto = xbase is None and ybase is None
+        key = (
+            x_is_log,
+            y_is_log,
+            tuple(self.fig.get_size_inches()),
+            self.fig.dpi,
+            tuple((ax.get_xlim(), ax.get_ylim()) for ax in self.axs),
+        )
+        if (
+            auto
+            and self._tick_base_cache is not None
+            and self._tick_base_cache[0] == key
+        ):
+            xbase, ybase = self._tick_base_cache[1]
+
         if xbase is None:
-            if self.axs[0].xaxis.get_scale() == "log":
-                xbase = max(
-                    ax.xaxis.get_ticklocs()[1] / ax.xaxis.get_ticklocs()[0]
-                    for ax in self.axs
-                    if ax.get_subplotspec().is_last_row()
-                )
-            else:
-                xbase = max(
-                    ax.xaxis.get_ticklocs()[1] - ax.xaxis.get_ticklocs()[0]
-                    for ax in self.axs
-                    if ax.get_subplotspec().is_last_row()
-                )
+            # axes with fewer than two ticks cannot contribute a base
+            xlocs = np.array(
+                [
+                    locs[:2]
+                    for ax in self.last_row
+                    for locs in (ax.xaxis.get_ticklocs(),)
+                    if len(locs) >= 2
+                ]
+            )
+            if len(xlocs):
+                if x_is_log:
+                    xbase = float(np.max(xlocs[:, 1] / xlocs[:, 0]))
+                else:
+                    xbase = float(np.max(xlocs[:, 1] - xlocs[:, 0]))
         if ybase is None:
-            if self.axs[0].yaxis.get_scale() == "log":
-                ybase = max(
-                    ax.yaxis.get_ticklocs()[1] / ax.yaxis.get_ticklocs()[0]
-                    for ax in self.axs
-                    if ax.get_subplotspec().is_first_col()
-                )
-            else:
-                ybase = max(
-                    ax.yaxis.get_ticklocs()[1] - ax.yaxis.get_ticklocs()[0]
-                    for ax in self.axs
-                    if ax.get_subplotspec().is_first_col()
-                )
-
-        for ax in self.axs:
-            if ax.get_subplotspec().is_first_col():
-                if ax.yaxis.get_scale() == "log":
-                    ax.yaxis.set_major_locator(ticker.LogLocator(ybase))
+            ylocs = np.array(
+                [
+                    locs[:2]
+                    for ax in self.first_col
+                    for locs in (ax.yaxis.get_ticklocs(),)
+                    if len(locs) >= 2
+                ]
+            )
+            if len(ylocs):
+                if y_is_log:
+                    ybase = float(np.max(ylocs[:, 1] / ylocs[:, 0]))
+                else:
+                    ybase = float(np.max(ylocs[:, 1] - ylocs[:, 0]))
+
+        # only memoize computed bases: an explicit caller-supplied base must
+        # not be replayed by later automatic calls
+        if auto:
+            self._tick_base_cache = (key, (xbase, ybase))
+
+        for meta in self._ax_meta:
+            ax = meta.ax
+            if ybase is not None and meta.is_first_col:
+                if y_is_log:
+                    ax.yaxis.set_major_locator(LogLocator(ybase))
                 else:
-                    ax.yaxis.set_major_locator(ticker.MultipleLocator(ybase))
-            if ax.get_subplotspec().is_last_row():
-                if ax.xaxis.get_scale() == "log":
-                    ax.xaxis.set_major_locator(ticker.LogLocator(xbase))
+                    ax.yaxis.set_major_locator(MultipleLocator(ybase))
+            if xbase is not None and meta.is_last_row:
+                if x_is_log:
+                    ax.xaxis.set_major_locator(LogLocator(xbase))
                 else:
-                    ax.xaxis.set_major_locator(ticker.MultipleLocator(xbase))
+                    ax.xaxis.set_major_locator(MultipleLocator(xbase))
+
+    def invalidate_ticks(self):
+        """Drop the memoized tick bases so the next `standardize_ticks`
+        recomputes them from the current ticks."""
+        self._tick_base_cache = None
 
     def fix_exponent(self):
-        for ax in self.axs:
-            subplotspec = ax.get_subplotspec()
-            if not (subplotspec.is_first_col() and subplotspec.is_first_row()):
-                ax.get_yaxis().get_offset_text().set_visible(False)
-            if not (subplotspec.is_last_col() and subplotspec.is_last_row()):
-                ax.get_xaxis().get_offset_text().set_visible(False)
+        for meta in self._ax_meta:
+            if not (meta.is_first_col and meta.is_first_row):
+                meta.ax.get_yaxis().get_offset_text().set_visible(False)
+            if not (meta.is_last_col and meta.is_last_row):
+                meta.ax.get_xaxis().get_offset_text().set_visible(False)
 
     def __getattr__(self, method):
         """Catch all methods that are not defined and pass to internal axes
         (e.g. plot, errorbar, etc.).
+
+        The delegator is cached in the instance dict on first access, so
+        subsequent lookups take the normal attribute path instead of
+        re-entering ``__getattr__`` and allocating a new delegator per call.
         """
-        if method in [
-            "get_yaxis",
-            "get_xaxis",
-            "get_shared_x_axes",
-            "get_shared_y_axes",
-            "get_second_yaxis",
-            "get_second_xaxis",
-            "get_legend",
-            "get_title",
-            "get_xlabel",
-            "get_ylabel",
-        ]:
-            return getattr(self.big_ax, method)
-
-        return lambda *args, **kwargs: self.subax_call(method, args, kwargs)
+        if method in _BIG_AX_METHODS:
+            delegator = getattr(self.big_ax, method)
+        else:
+            delegator = _SubaxDelegator(self, method)
+
+        self.__dict__[method] = delegator
+        return delegator
 
     def subax_call(self, method, args, kwargs):
         """Apply method call to all internal axes. Called by CallCurator."""
+        self._lims_cache = None  # plotting can change axis limits
+        self._apply_default_locators()
         result = []
         for ax in self.axs:
-            if ax.xaxis.get_scale() == "log":
-                ax.xaxis.set_major_locator(ticker.LogLocator())
-            else:
-                ax.xaxis.set_major_locator(ticker.AutoLocator())
-            if ax.yaxis.get_scale() == "log":
-                ax.yaxis.set_major_locator(ticker.LogLocator())
-            else:
-                ax.yaxis.set_major_locator(ticker.AutoLocator())
             result.append(getattr(ax, method)(*args, **kwargs))
 
+        # defer tick/spine standardization to the next draw rather than
+        # re-running it after every delegated call
+        self._fixup_dirty = True
+
+        return result
+
+    def _flush_fixups(self):
+        """Run the pending layout fixups queued by `subax_call`."""
+        if not self._fixup_dirty:
+            return
+        self._fixup_dirty = False
         self.standardize_ticks()
         self.set_spines()
         self.fix_exponent()
 
-        return result
-
     def set_xlabel(self, label, labelpad=15, **kwargs):
         return self.big_ax.set_xlabel(label, labelpad=labelpad, **kwargs)
 
@@ -372,17 +617,13 @@ class BrokenAxes:
     ):
         assert location in ["right", "left"], "location must be 'right' or 'left'"
         if location == "right":
-            [
-                ax.secondary_yaxis("right", functions=functions)
-                for ax in self.axs
-                if ax.get_subplotspec().is_last_col()
-            ]
+            for meta in self._ax_meta:
+                if meta.is_last_col:
+                    meta.ax.secondary_yaxis("right", functions=functions)
         else:
-            [
-                ax.secondary_yaxis("left", functions=functions)
-                for ax in self.axs
-                if ax.get_subplotspec().is_first_col()
-            ]
+            for meta in self._ax_meta:
+                if meta.is_first_col:
+                    meta.ax.secondary_yaxis("left", functions=functions)
         secax = self.big_ax.secondary_yaxis(location, functions=functions)
 
         secax.spines[location].set_visible(False)
@@ -397,17 +638,13 @@ class BrokenAxes:
     def secondary_xaxis(self, location="top", functions=None, label=None, labelpad=30):
         assert location in ["top", "bottom"], "location must be 'top' or 'bottom'"
         if location == "top":
-            [
-                ax.secondary_xaxis("top", functions=functions)
-                for ax in self.axs
-                if ax.get_subplotspec().is_first_row()
-            ]
+            for meta in self._ax_meta:
+                if meta.is_first_row:
+                    meta.ax.secondary_xaxis("top", functions=functions)
         else:
-            [
-                ax.secondary_xaxis("bottom", functions=functions)
-                for ax in self.axs
-                if ax.get_subplotspec().is_last_row()
-            ]
+            for meta in self._ax_meta:
+                if meta.is_last_row:
+                    meta.ax.secondary_xaxis("bottom", functions=functions)
         secax = self.big_ax.secondary_xaxis(location, functions=functions)
 
         secax.spines[location].set_visible(False)
@@ -421,23 +658,20 @@ class BrokenAxes:
 
     def text(self, x, y, s, *args, **kwargs):
         # find axes object that should contain text
-        for ax in self.axs:
-            xlim = ax.get_xlim()
-            ylim = ax.get_ylim()
-            if xlim[0] < x < xlim[1] and ylim[0] < y < ylim[1]:
-                return ax.text(x, y, s, *args, **kwargs)
+        if self._lims_cache is None:
+            self._lims_cache = np.array(
+                [[*ax.get_xlim(), *ax.get_ylim()] for ax in self.axs]
+            )
+        lims = self._lims_cache
+        mask = (lims[:, 0] < x) & (x < lims[:, 1]) & (lims[:, 2] < y) & (y < lims[:, 3])
+        idx = int(np.argmax(mask))
+        if mask[idx]:
+            return self.axs[idx].text(x, y, s, *args, **kwargs)
 
         raise ValueError("(x,y) coordinate of text not within any axes")
 
     @property
     def spines(self):
-        if self._spines is None:
-            self._spines = dict(
-                top=[ax.spines["top"] for ax in self.axs if ax.get_subplotspec().is_first_row()],
-                right=[ax.spines["right"] for ax in self.axs if ax.get_subplotspec().is_last_col()],
-                bottom=[ax.spines["bottom"] for ax in self.axs if ax.get_subplotspec().is_last_row()],
-                left=[ax.spines["left"] for ax in self.axs if ax.get_subplotspec().is_first_col()],
-            )
         return self._spines
 
 
@@ -0,0 +1,33 @@
+import os
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_font_cache():
+    """Render one throwaway figure up front.
+
+    The first savefig in a fresh process builds the matplotlib font cache,
+    which can take hundreds of milliseconds; doing it here keeps that fixed
+    cost out of the first test (and out of each worker under pytest-xdist).
+    """
+    fig = plt.figure(figsize=(1, 1))
+    fig.savefig(os.devnull, format="png")
+    plt.close(fig)
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close every figure after each test.
+
+    None of the tests close their figures, so without this the pyplot
+    figure registry would keep every rendered canvas alive for the whole
+    session.
+    """
+    yield
+    plt.close("all")
@@ -45,7 +45,7 @@ setup(
     # for example:
     # $ pip install -e .[test]
     extras_require={
-        'test': ['pytest>=6.0', 'pytest-cov', 'pytest-mpl'],
+        'test': ['pytest>=6.0', 'pytest-cov', 'pytest-mpl', 'pytest-xdist'],
     },
 
 